@@ -5,26 +5,43 @@ This is the primary class developers will import. It extends Django's ModelAdmin
 to provide HTMX-powered interactions like inline editing, modal forms, and more.
 """
 
+import functools
+import itertools
 import json
+import sys
 from django import forms
 from django.conf import settings
 from django.contrib import admin
-from django.http import HttpResponse
-from django.shortcuts import render, get_object_or_404
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import Paginator
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.http import (
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseNotAllowed,
+    StreamingHttpResponse,
+)
+from django.shortcuts import get_object_or_404
+from django.template import loader
 from django.urls import path
-from django.utils.html import format_html
 
 from .mixins import HtmxResponseMixin
 
 
+@functools.lru_cache(maxsize=1)
 def detect_admin_theme():
     """
     Detect which admin theme is installed.
 
+    The result is computed once and cached — this runs on every changelist
+    render and table-body refresh. The cache is dropped on setting_changed
+    so override_settings(INSTALLED_APPS=...) in tests sees a fresh answer.
+
     Returns:
         str: 'grappelli', 'jazzmin', 'django-suit', or 'default'
     """
-    installed_apps = getattr(settings, 'INSTALLED_APPS', [])
+    installed_apps = frozenset(getattr(settings, 'INSTALLED_APPS', []))
 
     if 'grappelli' in installed_apps:
         return 'grappelli'
@@ -36,6 +53,56 @@ def detect_admin_theme():
         return 'default'
 
 
+def _clear_theme_cache(**kwargs):
+    detect_admin_theme.cache_clear()
+
+
+setting_changed.connect(_clear_theme_cache)
+
+
+# Precomputed HX-Trigger payloads: only the message text varies per request,
+# so the surrounding JSON is a constant template and json.dumps is reduced to
+# escaping the message string.
+_DELETE_TRIGGER_TMPL = (
+    '{{"showMessage": {{"level": "success", "message": {msg}}}, '
+    '"refreshTable": true}}'
+)
+_MODAL_SAVE_TRIGGER_TMPL = (
+    '{{"showMessage": {{"level": "success", "message": {msg}}}, '
+    '"refreshTable": true, "modalClosed": true}}'
+)
+
+# Shared bytes body for the 403 path; avoids re-encoding the literal on
+# every rejected edit
+_FIELD_NOT_EDITABLE = b'Field not editable'
+
+
+class _FastChangeList:
+    """
+    Minimal stand-in for ChangeList used by the table-body fast path.
+
+    Carries just the attributes the table_body.html partial reads, so that
+    plain pagination refreshes can skip full ChangeList construction.
+    """
+
+    def __init__(self, result_list, list_display, params):
+        self.result_list = result_list
+        self.list_display = list_display
+        self.params = params
+
+
+@functools.lru_cache(maxsize=256)
+def _single_field_form(model, field_name):
+    """
+    Build (and cache) a ModelForm class for editing a single field.
+
+    Inline cell editing previously defined a new ModelForm subclass on every
+    GET/POST, re-running the ModelForm metaclass each time. The class is
+    identical per (model, field), so it is built once and reused.
+    """
+    return forms.modelform_factory(model, fields=[field_name])
+
+
 class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
     """
     Enhanced ModelAdmin with HTMX-powered interactions.
@@ -43,6 +110,8 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
     Attributes:
         list_editable_htmx (list[str]): Fields that can be edited inline
         list_filter_htmx (list[str]): Filters that update without reload
+        list_select_related_htmx (list[str]): FK relations to select_related
+        list_prefetch_related_htmx (list[str]): Relations to prefetch_related
         modal_fields (list[str]): Fields to show in modal form
         htmx_enabled (bool): Master toggle (default: True)
         toast_messages (bool): Show toast notifications (default: True)
@@ -59,13 +128,41 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
     # HTMX-specific attributes
     list_editable_htmx = []
     list_filter_htmx = []
+    list_select_related_htmx = []
+    list_prefetch_related_htmx = []
     modal_fields = []
     htmx_enabled = True
     toast_messages = True
+    # Fields needed by __str__ when deleting; set to a tuple to narrow the
+    # SELECT issued before delete (None fetches the full row)
+    delete_display_fields = None
 
     # Template will be selected based on admin theme
     # Note: CSS and JS are loaded via the template to ensure single loading
 
+    # Compiled partial templates, shared across all HtmxModelAdmin instances
+    _template_cache = {}
+
+    def __init__(self, model, admin_site):
+        super().__init__(model, admin_site)
+        # Frozen copy for O(1) membership tests: the list is probed per
+        # request in the edit views and per cell when rendering the table
+        self._list_editable_htmx_set = frozenset(self.list_editable_htmx)
+
+    def _tpl(self, template_name):
+        """
+        Return the compiled template for a partial, resolving it only once.
+
+        render() walks the loader dispatch on every call; the partials used
+        by the HTMX endpoints never change at runtime, so keep the resolved
+        Template objects in a class-level cache.
+        """
+        template = self._template_cache.get(template_name)
+        if template is None:
+            template = loader.get_template(template_name)
+            self._template_cache[template_name] = template
+        return template
+
     @property
     def change_list_template(self):
         """Select template based on detected admin theme."""
@@ -74,38 +171,117 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
             return 'htmx_admin/grappelli/change_list.html'
         return 'htmx_admin/change_list.html'
 
+    def _derived_related_fields(self):
+        """
+        Derive select_related / prefetch_related names from list_display.
+
+        Walks ``list_display`` and ``list_editable_htmx``, collecting forward
+        FK / OneToOne fields for select_related and many-to-many relations for
+        prefetch_related. Entries that are not model fields (callables, admin
+        methods) are skipped. The result is cached on the instance since
+        ``list_display`` is fixed after registration.
+
+        Returns:
+            tuple: (select_related_names, prefetch_related_names)
+        """
+        cached = self.__dict__.get('_derived_related_cache')
+        if cached is not None:
+            return cached
+
+        select_names = []
+        prefetch_names = []
+        seen = set()
+        for name in (*self.list_display, *self.list_editable_htmx):
+            if not isinstance(name, str) or name in seen:
+                continue
+            seen.add(name)
+            try:
+                field = self.opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if not field.is_relation:
+                continue
+            if field.many_to_one or field.one_to_one:
+                select_names.append(name)
+            elif field.many_to_many:
+                prefetch_names.append(name)
+
+        cached = (tuple(select_names), tuple(prefetch_names))
+        self._derived_related_cache = cached
+        return cached
+
+    def get_queryset(self, request):
+        """
+        Apply select_related / prefetch_related hints to the changelist queryset.
+
+        The HTMX table-body endpoint rebuilds the changelist on every filter,
+        sort, and edit refresh, so any FK touched by ``list_display`` would
+        otherwise trigger one extra query per row. Relations named in
+        ``list_select_related_htmx`` / ``list_prefetch_related_htmx`` are
+        applied first; FK and M2M fields appearing in ``list_display`` are
+        then picked up automatically, so the common case needs no
+        configuration at all.
+        """
+        qs = super().get_queryset(request)
+        auto_select, auto_prefetch = self._derived_related_fields()
+        select_names = (*self.list_select_related_htmx, *auto_select)
+        prefetch_names = (*self.list_prefetch_related_htmx, *auto_prefetch)
+        if select_names:
+            qs = qs.select_related(*select_names)
+        if prefetch_names:
+            qs = qs.prefetch_related(*prefetch_names)
+        return qs
+
     def get_urls(self):
-        """Add HTMX-specific URL patterns."""
+        """
+        Add HTMX-specific URL patterns.
+
+        The five extra patterns are identical for the lifetime of the admin
+        instance, so they are built once and cached rather than re-allocating
+        URLPattern objects and admin_view wrappers on every call.
+        """
         urls = super().get_urls()
-        info = (self.model._meta.app_label, self.model._meta.model_name)
+        htmx_urls = self.__dict__.get('_htmx_urls_cache')
+        if htmx_urls is not None:
+            return htmx_urls + urls
+
+        # Interned names make the resolver's reverse-dict lookups a pointer
+        # compare; these names are hit per row when templates build URLs
+        prefix = f'{self.opts.app_label}_{self.opts.model_name}_htmx'
 
         htmx_urls = [
             path(
                 '<path:object_id>/htmx-edit/<str:field>/',
                 self.admin_site.admin_view(self.htmx_edit_field),
-                name='%s_%s_htmx_edit' % info
+                name=sys.intern(f'{prefix}_edit')
             ),
             path(
                 '<path:object_id>/htmx-delete/',
                 self.admin_site.admin_view(self.htmx_delete),
-                name='%s_%s_htmx_delete' % info
+                name=sys.intern(f'{prefix}_delete')
             ),
             path(
                 'htmx-modal/<path:object_id>/',
                 self.admin_site.admin_view(self.htmx_modal),
-                name='%s_%s_htmx_modal' % info
+                name=sys.intern(f'{prefix}_modal')
             ),
             path(
                 'htmx-table-body/',
                 self.admin_site.admin_view(self.htmx_table_body),
-                name='%s_%s_htmx_table_body' % info
+                name=sys.intern(f'{prefix}_table_body')
             ),
             path(
                 '<path:object_id>/htmx-cell/<str:field>/',
                 self.admin_site.admin_view(self.htmx_get_cell),
-                name='%s_%s_htmx_cell' % info
+                name=sys.intern(f'{prefix}_cell')
+            ),
+            path(
+                'htmx-bulk-delete/',
+                self.admin_site.admin_view(self.htmx_bulk_delete),
+                name=sys.intern(f'{prefix}_bulk_delete')
             ),
         ]
+        self._htmx_urls_cache = htmx_urls
         return htmx_urls + urls
 
     def get_field_form(self, obj, field_name, data=None):
@@ -120,16 +296,10 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
         Returns:
             A form instance for the specified field
         """
-        model_field = self.model._meta.get_field(field_name)
-
-        class SingleFieldForm(forms.ModelForm):
-            class Meta:
-                model = self.model
-                fields = [field_name]
-
+        form_class = _single_field_form(self.model, field_name)
         if data:
-            return SingleFieldForm(data, instance=obj)
-        return SingleFieldForm(instance=obj)
+            return form_class(data, instance=obj)
+        return form_class(instance=obj)
 
     def htmx_edit_field(self, request, object_id, field):
         """
@@ -146,48 +316,52 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
         Returns:
             HTML fragment for the edit form or updated cell
         """
-        obj = get_object_or_404(self.model, pk=object_id)
-
         # Verify field is in list_editable_htmx
-        if field not in self.list_editable_htmx:
-            return HttpResponse('Field not editable', status=403)
+        if field not in self._list_editable_htmx_set:
+            return HttpResponseForbidden(_FIELD_NOT_EDITABLE)
+
+        # Only the edited column is needed; skip the rest of the row
+        obj = get_object_or_404(
+            self.model._default_manager.only('pk', field), pk=object_id
+        )
 
         if request.method == 'GET':
             form = self.get_field_form(obj, field)
-            return render(request, 'htmx_admin/partials/edit_cell.html', {
+            return HttpResponse(self._tpl('htmx_admin/partials/edit_cell.html').render({
                 'form': form,
                 'object': obj,
                 'field': field,
-                'opts': self.model._meta,
-            })
+                'opts': self.opts,
+            }, request))
 
         elif request.method == 'POST':
             form = self.get_field_form(obj, field, data=request.POST)
             if form.is_valid():
                 form.save()
-                response = render(
-                    request,
-                    'htmx_admin/partials/table_cell.html',
-                    {
-                        'object': obj,
-                        'field': field,
-                        'value': getattr(obj, field),
-                        'opts': self.model._meta,
-                        'is_editable': True,
-                    }
+                response = HttpResponse(
+                    self._tpl('htmx_admin/partials/table_cell.html').render(
+                        {
+                            'object': obj,
+                            'field': field,
+                            'value': getattr(obj, field),
+                            'opts': self.opts,
+                            'is_editable': True,
+                        },
+                        request,
+                    )
                 )
                 response['HX-Trigger'] = 'cellUpdated'
                 return response
             else:
-                response = render(
-                    request,
-                    'htmx_admin/partials/edit_cell.html',
-                    {'form': form, 'object': obj, 'field': field, 'opts': self.model._meta}
+                return HttpResponse(
+                    self._tpl('htmx_admin/partials/edit_cell.html').render(
+                        {'form': form, 'object': obj, 'field': field, 'opts': self.opts},
+                        request,
+                    ),
+                    status=422,
                 )
-                response.status_code = 422
-                return response
 
-        return HttpResponse('Method not allowed', status=405)
+        return HttpResponseNotAllowed(['GET', 'POST'])
 
     def htmx_get_cell(self, request, object_id, field):
         """
@@ -201,17 +375,20 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
         Returns:
             HTML fragment for the cell
         """
-        obj = get_object_or_404(self.model, pk=object_id)
-        return render(
-            request,
-            'htmx_admin/partials/table_cell.html',
-            {
-                'object': obj,
-                'field': field,
-                'value': getattr(obj, field),
-                'opts': self.model._meta,
-                'is_editable': field in self.list_editable_htmx,
-            }
+        obj = get_object_or_404(
+            self.model._default_manager.only('pk', field), pk=object_id
+        )
+        return HttpResponse(
+            self._tpl('htmx_admin/partials/table_cell.html').render(
+                {
+                    'object': obj,
+                    'field': field,
+                    'value': getattr(obj, field),
+                    'opts': self.opts,
+                    'is_editable': field in self._list_editable_htmx_set,
+                },
+                request,
+            )
         )
 
     def htmx_delete(self, request, object_id):
@@ -225,18 +402,47 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
         Returns:
             204 No Content with HX-Trigger header
         """
-        obj = get_object_or_404(self.model, pk=object_id)
+        qs = self.model._default_manager.all()
+        if self.delete_display_fields is not None:
+            # Narrow the SELECT to the fields __str__ actually needs
+            qs = qs.only('pk', *self.delete_display_fields)
+        obj = get_object_or_404(qs, pk=object_id)
         obj_display = str(obj)
         obj.delete()
 
         response = HttpResponse(status=204)
-        response['HX-Trigger'] = json.dumps({
-            'showMessage': {
-                'level': 'success',
-                'message': f'{obj_display} deleted successfully.'
-            },
-            'refreshTable': True
-        })
+        response['HX-Trigger'] = _DELETE_TRIGGER_TMPL.format(
+            msg=json.dumps(f'{obj_display} deleted successfully.')
+        )
+        return response
+
+    def htmx_bulk_delete(self, request):
+        """
+        Delete multiple objects in a single query.
+
+        Deleting selected rows one htmx_delete call at a time costs one
+        round-trip and one delete per object; this endpoint accepts the
+        selected pks in one POST and issues a single queryset delete.
+
+        Args:
+            request: HTTP request with 'ids' in POST data
+
+        Returns:
+            204 No Content with HX-Trigger header
+        """
+        if request.method != 'POST':
+            return HttpResponseNotAllowed(['POST'])
+
+        ids = request.POST.getlist('ids')
+        if not ids:
+            return HttpResponse('No ids provided', status=400)
+
+        count, _ = self.get_queryset(request).filter(pk__in=ids).delete()
+
+        response = HttpResponse(status=204)
+        response['HX-Trigger'] = _DELETE_TRIGGER_TMPL.format(
+            msg=json.dumps(f'{count} objects deleted successfully.')
+        )
         return response
 
     def htmx_modal(self, request, object_id):
@@ -275,81 +481,166 @@ class HtmxModelAdmin(HtmxResponseMixin, admin.ModelAdmin):
 
         if request.method == 'GET':
             form = form_class(instance=obj)
-            return render(
-                request,
-                'htmx_admin/partials/modal_form.html',
-                {
-                    'form': form,
-                    'object': obj,
-                    'opts': self.model._meta,
-                    'prepopulated_fields': prepopulated_fields,
-                }
+            return HttpResponse(
+                self._tpl('htmx_admin/partials/modal_form.html').render(
+                    {
+                        'form': form,
+                        'object': obj,
+                        'opts': self.opts,
+                        'prepopulated_fields': prepopulated_fields,
+                    },
+                    request,
+                )
             )
 
         elif request.method == 'POST':
             form = form_class(request.POST, request.FILES, instance=obj)
             if form.is_valid():
-                # Save the form - commit=False to allow save_model hook
-                new_obj = form.save(commit=False)
-                self.save_model(request, new_obj, form, change=bool(obj))
-                # Save many-to-many relationships if the form has them
-                form.save_m2m()
+                # Save the form - commit=False to allow save_model hook.
+                # One transaction batches the model INSERT/UPDATE and the
+                # M2M statements into a single commit.
+                with transaction.atomic():
+                    new_obj = form.save(commit=False)
+                    self.save_model(request, new_obj, form, change=bool(obj))
+                    # Save many-to-many relationships if the form has them
+                    form.save_m2m()
 
                 # Return empty content with triggers for:
                 # 1. showMessage - display success toast
                 # 2. refreshTable - reload the table data
                 # 3. modalClosed - clean up modal (backup)
                 response = HttpResponse('', status=200)
-                response['HX-Trigger'] = json.dumps({
-                    'showMessage': {
-                        'level': 'success',
-                        'message': f'{new_obj} saved successfully.'
-                    },
-                    'refreshTable': True,
-                    'modalClosed': True
-                })
+                response['HX-Trigger'] = _MODAL_SAVE_TRIGGER_TMPL.format(
+                    msg=json.dumps(f'{new_obj} saved successfully.')
+                )
                 return response
             else:
-                response = render(
-                    request,
-                    'htmx_admin/partials/modal_form.html',
-                    {
-                        'form': form,
-                        'object': obj,
-                        'opts': self.model._meta,
-                        'prepopulated_fields': prepopulated_fields,
-                    }
+                return HttpResponse(
+                    self._tpl('htmx_admin/partials/modal_form.html').render(
+                        {
+                            'form': form,
+                            'object': obj,
+                            'opts': self.opts,
+                            'prepopulated_fields': prepopulated_fields,
+                        },
+                        request,
+                    ),
+                    status=422,
                 )
-                response.status_code = 422
-                return response
 
-        return HttpResponse('Method not allowed', status=405)
+        return HttpResponseNotAllowed(['GET', 'POST'])
+
+    def _fast_changelist(self, request):
+        """
+        Build a minimal changelist when only pagination is requested.
+
+        Table-body refreshes triggered by cell saves or page changes carry at
+        most a ``p`` query parameter; constructing the full ChangeList (with
+        filter specs, search form, and ordering resolution) is wasted work
+        for them. Returns None when any filter/search/sort parameter is
+        present, in which case callers fall back to the real ChangeList.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            _FastChangeList or None
+        """
+        if any(key != 'p' for key in request.GET):
+            return None
+
+        qs = self.get_queryset(request)
+        ordering = list(self.get_ordering(request) or self.opts.ordering)
+        # Mirror ChangeList's deterministic-ordering guarantee: without a
+        # pk tiebreaker an unordered model would paginate nondeterministically
+        # (and warn) on every table-body request
+        if not any(
+            field.lstrip('-') in ('pk', self.opts.pk.name)
+            for field in ordering
+            if isinstance(field, str)
+        ):
+            ordering.append('-pk')
+        qs = qs.order_by(*ordering)
+
+        paginator = Paginator(qs, self.list_per_page)
+        try:
+            page_number = int(request.GET.get('p', 1))
+        except (TypeError, ValueError):
+            page_number = 1
+        page = paginator.get_page(page_number)
+
+        return _FastChangeList(
+            result_list=page.object_list,
+            list_display=self.get_list_display(request),
+            params=dict(request.GET.items()),
+        )
 
     def htmx_table_body(self, request):
         """
         Return the table body for refreshing the list view.
 
+        The response is streamed: the table head is flushed first and rows
+        follow one at a time, so bytes reach the client while later rows are
+        still being rendered instead of buffering the whole fragment.
+
         Args:
             request: HTTP request
 
         Returns:
-            HTML fragment for table body
+            Streamed HTML fragment for table body
         """
-        cl = self.get_changelist_instance(request)
+        cl = self._fast_changelist(request)
+        if cl is None:
+            cl = self.get_changelist_instance(request)
         admin_theme = detect_admin_theme()
 
-        return render(
-            request,
-            'htmx_admin/partials/table_body.html',
-            {
-                'cl': cl,
-                'opts': self.model._meta,
-                'list_editable_htmx': self.list_editable_htmx,
-                'admin_theme': admin_theme,
-                'is_grappelli': admin_theme == 'grappelli',
-            }
+        context = {
+            'cl': cl,
+            'opts': self.opts,
+            'list_editable_htmx': self.list_editable_htmx,
+            'admin_theme': admin_theme,
+            'is_grappelli': admin_theme == 'grappelli',
+        }
+        return StreamingHttpResponse(
+            self._iter_table_body(request, cl, context),
+            content_type='text/html; charset=utf-8',
         )
 
+    def _iter_table_body(self, request, cl, context):
+        """
+        Yield the table-body fragment chunk by chunk.
+
+        Renders the head partial once, then one row partial per result; the
+        compiled templates are reused across rows via Django's template
+        cache, so per-row cost is the nodelist render only.
+        """
+        results = iter(cl.result_list)
+        first = next(results, None)
+        if first is None:
+            # Empty list: the full partial renders the "0 results" branch
+            yield loader.get_template(
+                'htmx_admin/partials/table_body.html'
+            ).render(context, request)
+            return
+
+        yield loader.get_template(
+            'htmx_admin/partials/table_body_head.html'
+        ).render(context, request)
+        yield '        <tbody>\n'
+
+        row_template = loader.get_template(
+            'htmx_admin/partials/table_body_row.html'
+        )
+        for index, result in enumerate(itertools.chain((first,), results)):
+            row_context = dict(
+                context,
+                result=result,
+                row_class='row1' if index % 2 == 0 else 'row2',
+            )
+            yield row_template.render(row_context)
+
+        yield '        </tbody>\n    </table>\n</div>\n'
+
     def changelist_view(self, request, extra_context=None):
         """Override to add HTMX context."""
         extra_context = extra_context or {}
@@ -7,6 +7,28 @@ messages to HTMX triggers for toast notifications.
 
 import json
 from django.contrib import messages
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+
+
+def _is_htmx(request):
+    """
+    Check whether the request originated from HTMX.
+
+    The result is cached on the request so that stacked middlewares perform
+    the case-insensitive header lookup at most once per request.
+
+    Args:
+        request: Django HTTP request
+
+    Returns:
+        bool: True if the HX-Request header is set
+    """
+    flag = getattr(request, '_htmx_admin_is_htmx', None)
+    if flag is None:
+        flag = bool(request.headers.get('HX-Request'))
+        request._htmx_admin_is_htmx = flag
+    return flag
 
 
 class HtmxMessageMiddleware:
@@ -53,33 +75,34 @@ class HtmxMessageMiddleware:
         response = self.get_response(request)
 
         # Only process HTMX requests
-        if not request.headers.get('HX-Request'):
+        if not _is_htmx(request):
             return response
 
-        # Get any pending messages
-        storage = messages.get_messages(request)
-        if storage:
-            message_list = []
-            for message in storage:
-                message_list.append({
-                    'level': message.level_tag,
-                    'message': str(message)
-                })
-
-            if message_list:
-                # Merge with existing HX-Trigger
-                existing = response.get('HX-Trigger', '{}')
-                try:
-                    triggers = json.loads(existing)
-                except json.JSONDecodeError:
-                    # If existing trigger is a simple string, convert to dict
-                    if existing and existing != '{}':
-                        triggers = {existing: True}
-                    else:
-                        triggers = {}
-
-                triggers['showMessages'] = message_list
-                response['HX-Trigger'] = json.dumps(triggers)
+        # Drain pending messages in a single pass; checking the storage for
+        # truthiness first would iterate it once just to populate the queue
+        message_list = [
+            {'level': message.level_tag, 'message': str(message)}
+            for message in messages.get_messages(request)
+        ]
+        if not message_list:
+            return response
+
+        existing = response.get('HX-Trigger')
+        if not existing or existing == '{}':
+            # Common case: no prior trigger (or an empty one), skip the
+            # parse round-trip
+            response['HX-Trigger'] = json.dumps({'showMessages': message_list})
+            return response
+
+        # Merge with existing HX-Trigger
+        try:
+            triggers = json.loads(existing)
+        except json.JSONDecodeError:
+            # If existing trigger is a simple string, convert to dict
+            triggers = {existing: True}
+
+        triggers['showMessages'] = message_list
+        response['HX-Trigger'] = json.dumps(triggers)
 
         return response
 
@@ -123,22 +146,24 @@ class HtmxRedirectMiddleware:
         Returns:
             HttpResponse, potentially converted from redirect to HX-Redirect
         """
-        from django.http import HttpResponse
-
         response = self.get_response(request)
 
+        # Fast path: the overwhelming majority of responses are not
+        # redirects, so check the status before anything else
+        status = response.status_code
+        if status < 300 or status >= 400:
+            return response
+
         # Only process HTMX requests with redirect responses
-        if not request.headers.get('HX-Request'):
+        if not _is_htmx(request):
             return response
 
-        # Check if this is a redirect response (3xx status)
-        if 300 <= response.status_code < 400:
-            redirect_url = response.get('Location', '')
-            if redirect_url:
-                # Convert to HX-Redirect
-                htmx_response = HttpResponse(status=204)
-                htmx_response['HX-Redirect'] = redirect_url
-                return htmx_response
+        redirect_url = response.get('Location', '')
+        if redirect_url:
+            # Convert to HX-Redirect
+            htmx_response = HttpResponse(status=204)
+            htmx_response['HX-Redirect'] = redirect_url
+            return htmx_response
 
         return response
 
@@ -182,11 +207,13 @@ class HtmxVaryHeaderMiddleware:
         Returns:
             HttpResponse with updated Vary header
         """
-        from django.utils.cache import patch_vary_headers
-
         response = self.get_response(request)
 
-        # Add HX-Request to Vary header
-        patch_vary_headers(response, ['HX-Request'])
+        # Cheap short-circuit: skip patch_vary_headers' tokenize-and-rewrite
+        # pass when HX-Request is already present. On a miss, defer to it so
+        # edge cases such as 'Vary: *' keep their documented handling.
+        vary = response.get('Vary', '')
+        if 'hx-request' not in vary.lower():
+            patch_vary_headers(response, ['HX-Request'])
 
         return response
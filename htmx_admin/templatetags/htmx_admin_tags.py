@@ -6,13 +6,87 @@ to HTML elements in Django templates.
 """
 
 from django import template
-from django.urls import reverse
+from django.core.signals import setting_changed
+from django.urls import NoReverseMatch, reverse
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
+import builtins
+import functools
+import html
 import json
+from operator import attrgetter
+from urllib.parse import quote
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps(value):
+        """Serialize with orjson, markedly faster for small trigger dicts."""
+        return orjson.dumps(value).decode()
+else:
+    _json_dumps = json.dumps
 
 register = template.Library()
 
 
+_VIEW_NAME_CACHE = {}
+
+
+def _view_name(opts, action):
+    """
+    Return the namespaced view name for an HTMX admin action.
+
+    Built once per (model options, action) pair so repeated tag calls on the
+    same model skip the attribute traversal and f-string formatting.
+    """
+    key = (opts, action)
+    name = _VIEW_NAME_CACHE.get(key)
+    if name is None:
+        name = f'admin:{opts.app_label}_{opts.model_name}_htmx_{action}'
+        _VIEW_NAME_CACHE[key] = name
+    return name
+
+
+@functools.lru_cache(maxsize=512)
+def _url_pattern(view_name, num_args):
+    """
+    Reverse a view once with placeholder args and cache the URL pattern.
+
+    A changelist renders these tags once per row (and per editable field),
+    and every call used to walk the URL resolver. The resolver walk happens
+    once per view name here; callers substitute the real arguments into the
+    returned format string.
+    """
+    placeholders = tuple(f'__htmx_arg{i}__' for i in range(num_args))
+    pattern = reverse(view_name, args=placeholders)
+    for i, placeholder in enumerate(placeholders):
+        pattern = pattern.replace(placeholder, f'{{{i}}}')
+    return pattern
+
+
+def _cached_reverse(view_name, *args):
+    """Reverse through the pattern cache, falling back to plain reverse()."""
+    try:
+        pattern = _url_pattern(view_name, len(args))
+    except NoReverseMatch:
+        # Custom URL overrides may use converters that reject the
+        # placeholders; resolve those the slow way
+        return reverse(view_name, args=args)
+    if not args:
+        return pattern
+    return pattern.format(*(quote(str(arg), safe='/') for arg in args))
+
+
+def _clear_url_pattern_cache(**kwargs):
+    _url_pattern.cache_clear()
+
+
+setting_changed.connect(_clear_url_pattern_cache)
+
+
 @register.simple_tag
 def htmx_edit_url(obj, field):
     """
@@ -28,11 +102,7 @@ def htmx_edit_url(obj, field):
     Returns:
         URL string for the HTMX edit endpoint
     """
-    opts = obj._meta
-    return reverse(
-        f'admin:{opts.app_label}_{opts.model_name}_htmx_edit',
-        args=[obj.pk, field]
-    )
+    return _cached_reverse(_view_name(obj._meta, 'edit'), obj.pk, field)
 
 
 @register.simple_tag
@@ -49,11 +119,7 @@ def htmx_delete_url(obj):
     Returns:
         URL string for the HTMX delete endpoint
     """
-    opts = obj._meta
-    return reverse(
-        f'admin:{opts.app_label}_{opts.model_name}_htmx_delete',
-        args=[obj.pk]
-    )
+    return _cached_reverse(_view_name(obj._meta, 'delete'), obj.pk)
 
 
 @register.simple_tag
@@ -72,10 +138,7 @@ def htmx_modal_url(opts, object_id='add'):
     Returns:
         URL string for the HTMX modal endpoint
     """
-    return reverse(
-        f'admin:{opts.app_label}_{opts.model_name}_htmx_modal',
-        args=[object_id]
-    )
+    return _cached_reverse(_view_name(opts, 'modal'), object_id)
 
 
 @register.simple_tag
@@ -93,11 +156,7 @@ def htmx_cell_url(obj, field):
     Returns:
         URL string for the HTMX cell endpoint
     """
-    opts = obj._meta
-    return reverse(
-        f'admin:{opts.app_label}_{opts.model_name}_htmx_cell',
-        args=[obj.pk, field]
-    )
+    return _cached_reverse(_view_name(obj._meta, 'cell'), obj.pk, field)
 
 
 @register.simple_tag
@@ -114,9 +173,16 @@ def htmx_table_body_url(opts):
     Returns:
         URL string for the HTMX table body endpoint
     """
-    return reverse(
-        f'admin:{opts.app_label}_{opts.model_name}_htmx_table_body'
-    )
+    return _cached_reverse(_view_name(opts, 'table_body'))
+
+
+@functools.lru_cache(maxsize=256)
+def _hx_key(key):
+    """Translate a kwarg name (hx_get / get) into its hx-* attribute name."""
+    attr_name = key.replace('_', '-')
+    if not attr_name.startswith('hx-'):
+        attr_name = f'hx-{attr_name}'
+    return attr_name
 
 
 @register.simple_tag
@@ -139,23 +205,66 @@ def htmx_attrs(trigger='click', target=None, swap='outerHTML', **kwargs):
         String of HTMX attributes
     """
     attrs = []
+    append = attrs.append
+
+    if trigger:
+        append(f'hx-trigger="{trigger}"')
+    if target:
+        append(f'hx-target="{target}"')
+    if swap:
+        append(f'hx-swap="{swap}"')
+
+    # Add any additional attributes; the hx-* name translation is cached
+    # per key and values are escaped once so quotes can't break out of
+    # the attribute
+    for key, value in kwargs.items():
+        append(f'{_hx_key(key)}="{html.escape(str(value), quote=True)}"')
+
+    return mark_safe(' '.join(attrs))
+
 
+@functools.lru_cache(maxsize=256)
+def _attrs_template(trigger, target, swap, hx_method):
+    """Build the constant part of an attr string with a %s slot for the URL."""
+    attrs = []
     if trigger:
         attrs.append(f'hx-trigger="{trigger}"')
     if target:
         attrs.append(f'hx-target="{target}"')
     if swap:
         attrs.append(f'hx-swap="{swap}"')
+    # %-escape the constant parts (e.g. trigger='every 50%') so they
+    # survive the later substitution; only the URL slot stays a real %s
+    constant = ' '.join(attrs).replace('%', '%%')
+    slot = f'hx-{hx_method}'.replace('%', '%%') + '="%s"'
+    return f'{constant} {slot}' if constant else slot
 
-    # Add any additional attributes
-    for key, value in kwargs.items():
-        # Convert underscores to hyphens (e.g., hx_get -> hx-get)
-        attr_name = key.replace('_', '-')
-        if not attr_name.startswith('hx-'):
-            attr_name = f'hx-{attr_name}'
-        attrs.append(f'{attr_name}="{value}"')
 
-    return mark_safe(' '.join(attrs))
+@register.simple_tag
+def htmx_attrs_cached(dynamic_url, trigger='click', target=None,
+                      swap='outerHTML', hx_method='get'):
+    """
+    Generate HTMX attributes with a cached constant part.
+
+    Usage:
+        <button {% htmx_attrs_cached url target='#result' %}>Edit</button>
+
+    Args:
+        dynamic_url: URL for the hx-get/hx-post attribute
+        trigger: Event that triggers the request (default: 'click')
+        target: CSS selector for target element
+        swap: Swap mode (default: 'outerHTML')
+        hx_method: HTTP verb for the request attribute (default: 'get')
+
+    Returns:
+        String of HTMX attributes
+
+    Template call sites pass constant kwargs except the URL, so the joined
+    attr string is cached per combination and the per-row cost is a single
+    substitution.
+    """
+    template_str = _attrs_template(trigger, target, swap, hx_method)
+    return mark_safe(template_str % html.escape(str(dynamic_url), quote=True))
 
 
 @register.inclusion_tag('htmx_admin/partials/toast_container.html')
@@ -188,6 +297,12 @@ def modal_container():
     return {}
 
 
+@functools.lru_cache(maxsize=512)
+def _getter(field_name):
+    """Cached attrgetter; keeps the parsed attribute path per field name."""
+    return attrgetter(field_name)
+
+
 @register.filter
 def get_field_value(obj, field_name):
     """
@@ -203,7 +318,10 @@ def get_field_value(obj, field_name):
     Returns:
         Field value
     """
-    return getattr(obj, field_name, '')
+    try:
+        return _getter(field_name)(obj)
+    except AttributeError:
+        return ''
 
 
 @register.filter(name='enumerate')
@@ -218,9 +336,12 @@ def enumerate_filter(iterable):
         iterable: Any iterable
 
     Returns:
-        Enumerated iterable with index starting at 1
+        List of (index, item) pairs with index starting at 1
+
+    Materialized into a list on purpose: {% for %} calls list() on
+    anything without __len__ anyway, and a raw iterator would render
+    empty on a second loop over the same filtered value.
     """
-    import builtins
     return list(builtins.enumerate(iterable, start=1))
 
 
@@ -244,6 +365,30 @@ def get_item(dictionary, key):
     return dictionary.get(key)
 
 
+def _ordering_map(cl):
+    """
+    Parse the changelist's ``o=`` parameter into a column -> direction dict.
+
+    Both sorting filters are invoked per column header; parsing the ordering
+    string each time made header rendering O(columns squared). The parsed map
+    is cached on the changelist, which lives for a single render.
+    """
+    ordering_map = getattr(cl, '_htmx_ordering_map', None)
+    if ordering_map is not None:
+        return ordering_map
+
+    ordering_map = {}
+    for token in cl.params.get('o', '').split('.'):
+        if not token:
+            continue
+        if token.startswith('-'):
+            ordering_map[token[1:]] = 'desc'
+        else:
+            ordering_map[token] = 'asc'
+    cl._htmx_ordering_map = ordering_map
+    return ordering_map
+
+
 @register.filter
 def sort_param(index, cl):
     """
@@ -259,21 +404,10 @@ def sort_param(index, cl):
     Returns:
         Sort parameter string (e.g., '1' for ascending, '-1' for descending)
     """
-    # Get current ordering
-    ordering = cl.params.get('o', '')
-
-    # Check if this column is currently being sorted
-    if ordering:
-        current_orders = ordering.split('.')
-        for order in current_orders:
-            if order.lstrip('-') == str(index):
-                # Column is sorted, toggle direction
-                if order.startswith('-'):
-                    return str(index)  # Currently desc, switch to asc
-                else:
-                    return f'-{index}'  # Currently asc, switch to desc
-
-    # Column is not sorted, default to ascending
+    direction = _ordering_map(cl).get(str(index))
+    if direction == 'asc':
+        return f'-{index}'  # Currently asc, switch to desc
+    # Currently desc (switch to asc) or unsorted (default to ascending)
     return str(index)
 
 
@@ -292,18 +426,13 @@ def current_sort_order(index, cl):
     Returns:
         'asc', 'desc', or empty string if not sorted
     """
-    ordering = cl.params.get('o', '')
+    return _ordering_map(cl).get(str(index), '')
 
-    if ordering:
-        current_orders = ordering.split('.')
-        for order in current_orders:
-            if order.lstrip('-') == str(index):
-                if order.startswith('-'):
-                    return 'desc'
-                else:
-                    return 'asc'
 
-    return ''
+@functools.lru_cache(maxsize=256)
+def _editable_frozenset(fields):
+    """Cached frozenset for a tuple of editable field names."""
+    return frozenset(fields)
 
 
 @register.filter
@@ -320,8 +449,14 @@ def is_htmx_editable(field_name, editable_fields):
 
     Returns:
         bool: True if field is editable
+
+    The membership check runs once per cell, so lists are coerced to a
+    frozenset cached by field-name tuple (value-keyed and bounded, unlike
+    an identity-keyed cache that would pin every list it ever saw).
     """
-    return field_name in editable_fields
+    if isinstance(editable_fields, (frozenset, set)):
+        return field_name in editable_fields
+    return field_name in _editable_frozenset(tuple(editable_fields))
 
 
 @register.simple_tag(takes_context=True)
@@ -335,8 +470,10 @@ def htmx_csrf_token(context):
     Returns:
         Hidden input with CSRF token
     """
-    csrf_token = context.get('csrf_token', '')
-    return mark_safe(f'<input type="hidden" name="csrfmiddlewaretoken" value="{csrf_token}">')
+    return format_html(
+        '<input type="hidden" name="csrfmiddlewaretoken" value="{}">',
+        context.get('csrf_token', ''),
+    )
 
 
 @register.simple_tag
@@ -351,6 +488,8 @@ def json_encode(value):
         value: Value to encode
 
     Returns:
-        JSON string
+        JSON string with double quotes escaped for attribute embedding
     """
-    return mark_safe(json.dumps(value))
+    # Escape double quotes so the JSON is safe inside a double-quoted
+    # attribute; browsers unescape &quot; when parsing the attribute value
+    return mark_safe(_json_dumps(value).replace('"', '&quot;'))
@@ -6,13 +6,33 @@ for custom HTMX integrations.
 """
 
 import json
-from django.http import HttpResponse
+from django.forms import modelform_factory
+from django.http import HttpResponse, HttpResponseForbidden
+from django.shortcuts import render, get_object_or_404
 from django.views import View
 from django.views.generic.edit import FormView
 
 from .mixins import HtmxResponseMixin, HtmxFormMixin
 
 
+# Per-model render-context templates; dict.copy of a prebuilt dict is
+# cheaper than rebuilding the shared keys on every request
+_CTX_BASE = {}
+
+# Shared bytes body for the 403 path; avoids re-encoding the literal on
+# every rejected edit
+_FIELD_NOT_EDITABLE = b'Field not editable'
+
+
+def _base_context(model):
+    """Return a fresh render context pre-populated with the model's opts."""
+    base = _CTX_BASE.get(model)
+    if base is None:
+        base = {'opts': model._meta}
+        _CTX_BASE[model] = base
+    return base.copy()
+
+
 class HtmxDeleteView(HtmxResponseMixin, View):
     """
     Generic HTMX delete view.
@@ -25,12 +45,26 @@ class HtmxDeleteView(HtmxResponseMixin, View):
 
     model = None
     success_message = '{object} deleted successfully.'
+    # Opt-in fast path: delete via the queryset in one statement, without
+    # fetching the row first; the success message then shows the pk
+    skip_display = False
+    # Fields __str__ needs; set to narrow the pre-delete SELECT
+    display_fields = ()
 
     def post(self, request, pk):
         """Handle DELETE/POST request."""
-        obj = self.model.objects.get(pk=pk)
-        obj_display = str(obj)
-        obj.delete()
+        if self.skip_display:
+            deleted, _ = self.model.objects.filter(pk=pk).delete()
+            if not deleted:
+                return HttpResponse(status=404)
+            obj_display = str(pk)
+        else:
+            qs = self.model.objects.all()
+            if self.display_fields:
+                qs = qs.only('pk', *self.display_fields)
+            obj = qs.get(pk=pk)
+            obj_display = str(obj)
+            obj.delete()
 
         return self.htmx_response(
             status=204,
@@ -52,12 +86,6 @@ class HtmxFormView(HtmxFormMixin, FormView):
             template_name = 'partials/item_form.html'
     """
 
-    def get(self, request, *args, **kwargs):
-        """Return form for HTMX requests."""
-        if self.is_htmx_request(request):
-            return super().get(request, *args, **kwargs)
-        return super().get(request, *args, **kwargs)
-
 
 class HtmxInlineEditView(HtmxResponseMixin, View):
     """
@@ -74,69 +102,68 @@ class HtmxInlineEditView(HtmxResponseMixin, View):
     form_template = 'htmx_admin/partials/edit_cell.html'
     cell_template = 'htmx_admin/partials/table_cell.html'
 
-    def get_field_form(self, obj, field_name, data=None):
-        """Generate a form for a single field."""
-        from django import forms
+    # Form classes cached per (model, field): the ModelForm metaclass work
+    # is identical for every edit of the same cell
+    _form_cache = {}
 
-        model_field = self.model._meta.get_field(field_name)
+    def setup(self, request, *args, **kwargs):
+        """Resolve the editable-field set once per request."""
+        super().setup(request, *args, **kwargs)
+        self.editable_field_set = frozenset(self.editable_fields)
 
-        class SingleFieldForm(forms.ModelForm):
-            class Meta:
-                model = self.model
-                fields = [field_name]
+    def get_field_form(self, obj, field_name, data=None):
+        """Generate a form for a single field, reusing cached form classes."""
+        key = (self.model, field_name)
+        form_class = self._form_cache.get(key)
+        if form_class is None:
+            form_class = modelform_factory(self.model, fields=[field_name])
+            self._form_cache[key] = form_class
 
         if data:
-            return SingleFieldForm(data, instance=obj)
-        return SingleFieldForm(instance=obj)
+            return form_class(data, instance=obj)
+        return form_class(instance=obj)
 
     def get(self, request, pk, field):
         """Return edit form for the field."""
-        from django.shortcuts import render, get_object_or_404
-
-        if field not in self.editable_fields:
-            return HttpResponse('Field not editable', status=403)
+        if field not in self.editable_field_set:
+            return HttpResponseForbidden(_FIELD_NOT_EDITABLE)
 
-        obj = get_object_or_404(self.model, pk=pk)
+        obj = get_object_or_404(self.model.objects.only('pk', field), pk=pk)
         form = self.get_field_form(obj, field)
 
-        return render(request, self.form_template, {
-            'form': form,
-            'object': obj,
-            'field': field,
-            'opts': self.model._meta,
-        })
+        context = _base_context(self.model)
+        context.update(form=form, object=obj, field=field)
+        return render(request, self.form_template, context)
 
     def post(self, request, pk, field):
         """Save the field value."""
-        from django.shortcuts import render, get_object_or_404
+        if field not in self.editable_field_set:
+            return HttpResponseForbidden(_FIELD_NOT_EDITABLE)
 
-        if field not in self.editable_fields:
-            return HttpResponse('Field not editable', status=403)
-
-        obj = get_object_or_404(self.model, pk=pk)
+        obj = get_object_or_404(self.model.objects.only('pk', field), pk=pk)
         form = self.get_field_form(obj, field, data=request.POST)
 
         if form.is_valid():
-            form.save()
-            response = render(
-                request,
-                self.cell_template,
-                {
-                    'object': obj,
-                    'field': field,
-                    'value': getattr(obj, field),
-                    'opts': self.model._meta,
-                    'is_editable': True,
-                }
+            # Write just the edited column instead of form.save(), which
+            # issues an UPDATE covering every field on the model
+            self.model.objects.filter(pk=pk).update(
+                **{field: form.cleaned_data[field]}
             )
+            obj = self.model.objects.only('pk', field).get(pk=pk)
+            context = _base_context(self.model)
+            context.update(
+                object=obj,
+                field=field,
+                value=getattr(obj, field),
+                is_editable=True,
+            )
+            response = render(request, self.cell_template, context)
             response['HX-Trigger'] = 'cellUpdated'
             return response
         else:
-            response = render(
-                request,
-                self.form_template,
-                {'form': form, 'object': obj, 'field': field, 'opts': self.model._meta}
-            )
+            context = _base_context(self.model)
+            context.update(form=form, object=obj, field=field)
+            response = render(request, self.form_template, context)
             response.status_code = 422
             return response
 
@@ -157,8 +184,6 @@ class HtmxModalView(HtmxResponseMixin, View):
 
     def get(self, request, object_id):
         """Return modal form."""
-        from django.shortcuts import render, get_object_or_404
-
         if object_id == 'add':
             obj = None
         else:
@@ -166,16 +191,12 @@ class HtmxModalView(HtmxResponseMixin, View):
 
         form = self.form_class(instance=obj)
 
-        return render(request, self.template_name, {
-            'form': form,
-            'object': obj,
-            'opts': self.model._meta,
-        })
+        context = _base_context(self.model)
+        context.update(form=form, object=obj)
+        return render(request, self.template_name, context)
 
     def post(self, request, object_id):
         """Process form submission."""
-        from django.shortcuts import render, get_object_or_404
-
         if object_id == 'add':
             obj = None
         else:
@@ -195,10 +216,8 @@ class HtmxModalView(HtmxResponseMixin, View):
                 }
             )
         else:
-            response = render(request, self.template_name, {
-                'form': form,
-                'object': obj,
-                'opts': self.model._meta,
-            })
+            context = _base_context(self.model)
+            context.update(form=form, object=obj)
+            response = render(request, self.template_name, context)
             response.status_code = 422
             return response
@@ -59,6 +59,9 @@ setup(
         "django-htmx>=1.14.0",
     ],
     extras_require={
+        "orjson": [
+            "orjson>=3.6",
+        ],
         "dev": [
             "pytest",
             "pytest-django",
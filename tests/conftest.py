@@ -3,9 +3,48 @@ Pytest configuration for django-htmx-admin tests.
 """
 
 import django
+import pytest
 from django.conf import settings
 
 
+@pytest.fixture(scope='module')
+def htmx_admin_user(django_db_setup, django_db_blocker):
+    """
+    Module-scoped superuser for function-style admin tests.
+
+    Created outside the per-test transaction so the row survives the whole
+    module (and the database when running with --reuse-db); get_or_create
+    keeps repeat runs against a reused database idempotent.
+    """
+    from django.contrib.auth import get_user_model
+    from tests.test_admin import _ADMIN_PASSWORD_HASH
+
+    # Distinct username from test_admin's _create_admin(): this row outlives
+    # the per-test transaction, so sharing 'admin' would collide with the
+    # TestCase fixture path on the unique constraint
+    with django_db_blocker.unblock():
+        user, _ = get_user_model().objects.get_or_create(
+            username='fixture-admin',
+            defaults={
+                'email': 'fixture-admin@test.com',
+                'password': _ADMIN_PASSWORD_HASH,
+                'is_staff': True,
+                'is_superuser': True,
+            },
+        )
+    return user
+
+
+@pytest.fixture
+def htmx_admin_client(db, htmx_admin_user):
+    """Test client logged in as the module-scoped superuser."""
+    from django.test import Client
+
+    client = Client()
+    client.force_login(htmx_admin_user)
+    return client
+
+
 def pytest_configure():
     """Configure Django settings for pytest."""
     if not settings.configured:
@@ -2,219 +2,179 @@
 Tests for HtmxModelAdmin.
 """
 
-from decimal import Decimal
-from django.test import TestCase, Client
-from django.contrib.auth.models import User
-from django.urls import reverse
+import unittest
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import TestCase
 
-class HtmxAdminTestCase(TestCase):
-    """Base test case for HTMX admin tests."""
+ADMIN_PASSWORD = 'adminpass123'
+# Hash once at import: create_superuser would re-run the PBKDF2 loop in
+# every subclass's setUpTestData, and the hash is identical each time.
+# The row itself still has to be created per class because TestCase rolls
+# the class-level fixture back when the class finishes.
+_ADMIN_PASSWORD_HASH = make_password(ADMIN_PASSWORD)
+
+
+def _create_admin():
+    """Create the shared superuser row using the precomputed hash."""
+    return get_user_model().objects.create(
+        username='admin',
+        email='admin@test.com',
+        password=_ADMIN_PASSWORD_HASH,
+        is_staff=True,
+        is_superuser=True,
+    )
+
+
+class HtmxAdminMixin:
+    """
+    Shared helpers for HTMX admin tests.
+
+    Kept as a plain mixin so future DB-free admin tests can compose it
+    with SimpleTestCase instead of paying for the transactional base.
+    """
+
+    # Shared constant: the header dict never changes, and the test client
+    # copies kwargs into the WSGI environ, so one dict serves every request
+    HTMX_HEADERS = {'HTTP_HX_REQUEST': 'true'}
+
+    @classmethod
+    def _make_admin(cls):
+        """Create the superuser row with the precomputed hash."""
+        return _create_admin()
+
+
+class HtmxAdminTestCase(HtmxAdminMixin, TestCase):
+    """Base test case for HTMX admin tests that hit the database."""
 
     @classmethod
     def setUpTestData(cls):
         """Create admin user for testing."""
-        cls.admin_user = User.objects.create_superuser(
-            username='admin',
-            email='admin@test.com',
-            password='adminpass123'
-        )
+        cls.admin_user = cls._make_admin()
 
     def setUp(self):
-        """Set up test client and login."""
-        self.client = Client()
-        self.client.login(username='admin', password='adminpass123')
-
-    def htmx_headers(self):
-        """Return headers for HTMX requests."""
-        return {'HTTP_HX_REQUEST': 'true'}
-
-
-class InlineEditValidationErrorTest(HtmxAdminTestCase):
-    """Test 1: Inline Edit - Validation Error"""
-
-    def test_inline_edit_validation_error(self):
-        """
-        Test that validation errors return 422 status with form errors.
-
-        This test verifies:
-        - Invalid data returns 422 status code
-        - Response contains error message
-        - Original value is unchanged
-        """
-        # Note: This test requires a model to be registered with HtmxModelAdmin
-        # Example implementation with a Product model:
-        #
-        # from shop.models import Product
-        # product = Product.objects.create(name='Test', price=10.00)
-        #
-        # response = self.client.post(
-        #     reverse('admin:shop_product_htmx_edit', args=[product.pk, 'price']),
-        #     data={'price': 'invalid'},
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 422)
-        # self.assertContains(response, 'Enter a number', status_code=422)
-        pass
-
-
-class InlineEditSuccessTest(HtmxAdminTestCase):
-    """Test 2: Inline Edit - Success"""
-
-    def test_inline_edit_success(self):
-        """
-        Test that successful edit returns 200 with updated cell.
-
-        This test verifies:
-        - Valid data returns 200 status code
-        - HX-Trigger header is set to 'cellUpdated'
-        - Database value is updated
-        """
-        # Note: This test requires a model to be registered with HtmxModelAdmin
-        # Example implementation:
-        #
-        # from shop.models import Product
-        # product = Product.objects.create(name='Test', price=10.00)
-        #
-        # response = self.client.post(
-        #     reverse('admin:shop_product_htmx_edit', args=[product.pk, 'price']),
-        #     data={'price': '25.00'},
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 200)
-        # self.assertIn('cellUpdated', response['HX-Trigger'])
-        #
-        # product.refresh_from_db()
-        # self.assertEqual(product.price, Decimal('25.00'))
-        pass
-
-
-class DeleteOperationTest(HtmxAdminTestCase):
-    """Test 3: Delete Operation"""
-
-    def test_htmx_delete(self):
-        """
-        Test that delete returns 204 with HX-Trigger.
-
-        This test verifies:
-        - Delete request returns 204 status code
-        - Object is deleted from database
-        - HX-Trigger contains 'rowDeleted'
-        """
-        # Note: This test requires a model to be registered with HtmxModelAdmin
-        # Example implementation:
-        #
-        # from shop.models import Product
-        # product = Product.objects.create(name='Test', price=10.00)
-        # initial_count = Product.objects.count()
-        #
-        # response = self.client.post(
-        #     reverse('admin:shop_product_htmx_delete', args=[product.pk]),
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 204)
-        # self.assertEqual(Product.objects.count(), initial_count - 1)
-        # self.assertIn('rowDeleted', response['HX-Trigger'])
-        pass
-
-
-class ModalFormCreateTest(HtmxAdminTestCase):
-    """Test 4: Modal Form - Create"""
-
-    def test_modal_create(self):
-        """
-        Test that modal create returns 204 and creates object.
-
-        This test verifies:
-        - Form submission returns 204 status code
-        - New object is created in database
-        - HX-Trigger contains 'tableRefresh'
-        """
-        # Note: This test requires a model to be registered with HtmxModelAdmin
-        # Example implementation:
-        #
-        # from shop.models import Product
-        # initial_count = Product.objects.count()
-        #
-        # response = self.client.post(
-        #     reverse('admin:shop_product_htmx_modal', args=['add']),
-        #     data={'name': 'New Product', 'price': '99.99'},
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 204)
-        # self.assertEqual(Product.objects.count(), initial_count + 1)
-        # self.assertIn('tableRefresh', response['HX-Trigger'])
-        pass
-
-
-class ModalFormGetTest(HtmxAdminTestCase):
-    """Test: Modal Form - GET Request"""
-
-    def test_modal_get_add(self):
-        """Test that GET request for add modal returns form."""
-        # Example implementation:
-        #
-        # response = self.client.get(
-        #     reverse('admin:shop_product_htmx_modal', args=['add']),
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 200)
-        # self.assertContains(response, 'modal-dialog')
-        pass
-
-    def test_modal_get_edit(self):
-        """Test that GET request for edit modal returns form with data."""
-        # Example implementation:
-        #
-        # from shop.models import Product
-        # product = Product.objects.create(name='Test', price=10.00)
-        #
-        # response = self.client.get(
-        #     reverse('admin:shop_product_htmx_modal', args=[product.pk]),
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 200)
-        # self.assertContains(response, 'Test')
-        pass
-
-
-class NonHtmxRequestTest(HtmxAdminTestCase):
-    """Test: Non-HTMX requests fallback to normal behavior."""
-
-    def test_changelist_non_htmx(self):
-        """Test that non-HTMX requests return full page."""
-        # Example implementation:
-        #
-        # response = self.client.get(
-        #     reverse('admin:shop_product_changelist')
-        # )
-        #
-        # self.assertEqual(response.status_code, 200)
-        # self.assertContains(response, 'DOCTYPE html')
-        pass
-
-
-class FieldEditableRestrictionTest(HtmxAdminTestCase):
-    """Test: Only fields in list_editable_htmx can be edited."""
-
-    def test_non_editable_field_returns_403(self):
-        """Test that trying to edit a non-editable field returns 403."""
-        # Example implementation:
-        #
-        # from shop.models import Product
-        # product = Product.objects.create(name='Test', price=10.00)
-        #
-        # # Assuming 'name' is NOT in list_editable_htmx
-        # response = self.client.get(
-        #     reverse('admin:shop_product_htmx_edit', args=[product.pk, 'name']),
-        #     **self.htmx_headers()
-        # )
-        #
-        # self.assertEqual(response.status_code, 403)
-        pass
+        """Log the framework-provided test client in."""
+        # TestCase._pre_setup already assigned a fresh Client to
+        # self.client; force_login skips the auth backend's password
+        # verification and just writes the session
+        self.client.force_login(self.admin_user)
+
+
+# Endpoint scenarios for a sample model registered with HtmxModelAdmin.
+# Each entry describes the request to make against the admin view (URL name
+# suffix, method, payload) and what to assert on the response. Running them
+# through one class means setUpTestData creates the superuser once for the
+# whole set instead of once per scenario class.
+SCENARIOS = [
+    {
+        'name': 'inline_edit_validation_error',
+        'method': 'post',
+        'url': 'htmx_edit',  # args: [obj.pk, 'price']
+        'data': {'price': 'invalid'},
+        'expected_status': 422,
+        'expected_contains': 'Enter a number',
+    },
+    {
+        'name': 'inline_edit_success',
+        'method': 'post',
+        'url': 'htmx_edit',  # args: [obj.pk, 'price']
+        'data': {'price': '25.00'},
+        'expected_status': 200,
+        'expected_trigger': 'cellUpdated',
+    },
+    {
+        'name': 'htmx_delete',
+        'method': 'post',
+        'url': 'htmx_delete',  # args: [obj.pk]
+        'data': None,
+        'expected_status': 204,
+        'expected_trigger': 'rowDeleted',
+    },
+    {
+        'name': 'modal_create',
+        'method': 'post',
+        'url': 'htmx_modal',  # args: ['add']
+        'data': {'name': 'New Product', 'price': '99.99'},
+        'expected_status': 204,
+        'expected_trigger': 'tableRefresh',
+    },
+    {
+        'name': 'modal_get_add',
+        'method': 'get',
+        'url': 'htmx_modal',  # args: ['add']
+        'data': None,
+        'expected_status': 200,
+        'expected_contains': 'modal-dialog',
+    },
+    {
+        'name': 'modal_get_edit',
+        'method': 'get',
+        'url': 'htmx_modal',  # args: [obj.pk]
+        'data': None,
+        'expected_status': 200,
+        'expected_contains': 'Test',
+    },
+    {
+        'name': 'changelist_non_htmx',
+        'method': 'get',
+        'url': 'changelist',  # no HTMX headers: full page expected
+        'data': None,
+        'expected_status': 200,
+        'expected_contains': 'DOCTYPE html',
+    },
+    {
+        'name': 'non_editable_field_returns_403',
+        'method': 'get',
+        'url': 'htmx_edit',  # args: [obj.pk, 'name'] not in list_editable_htmx
+        'data': None,
+        'expected_status': 403,
+    },
+]
+
+
+@unittest.skip('pending sample model registration')
+class HtmxAdminScenarioTest(HtmxAdminTestCase):
+    """
+    Data-driven coverage of the HTMX admin endpoints.
+
+    Each scenario needs a model registered with HtmxModelAdmin; until the
+    test project ships one (e.g. a shop.Product with price in
+    list_editable_htmx), the class is skipped as a whole. Example body once
+    the model exists:
+
+        from shop.models import Product
+
+        def test_scenarios(self):
+            product = Product.objects.create(name='Test', price=10.00)
+            for sc in SCENARIOS:
+                with self.subTest(name=sc['name']):
+                    url = reverse(f"admin:shop_product_{sc['url']}", ...)
+                    response = getattr(self.client, sc['method'])(
+                        url, data=sc['data'], **self.HTMX_HEADERS
+                    )
+                    self.assertEqual(
+                        response.status_code, sc['expected_status']
+                    )
+                    if 'expected_trigger' in sc:
+                        self.assertIn(
+                            sc['expected_trigger'], response['HX-Trigger']
+                        )
+    """
+
+    def test_scenarios(self):
+        """Run every scenario against the registered sample model."""
+        for sc in SCENARIOS:
+            with self.subTest(name=sc['name']):
+                pass
+
+
+def test_htmx_admin_client_fixture(htmx_admin_client, htmx_admin_user):
+    """The fixture client carries a session logged in as the superuser."""
+    # The minimal test settings define no MIDDLEWARE, so a full admin-view
+    # round trip is not possible here; assert the fixture's contract (a
+    # force_login session for the shared superuser) directly
+    session = htmx_admin_client.session
+
+    assert session['_auth_user_id'] == str(htmx_admin_user.pk)
+    assert htmx_admin_user.is_superuser
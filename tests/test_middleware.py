@@ -2,9 +2,10 @@
 Tests for HTMX middleware.
 """
 
+import copy
 import json
-from django.test import TestCase, RequestFactory
-from django.http import HttpResponse
+from django.test import SimpleTestCase, RequestFactory
+from django.http import HttpResponse, HttpResponseRedirect
 from django.contrib.messages import constants as message_constants
 from django.contrib.messages.storage.base import Message
 
@@ -12,26 +13,42 @@ from htmx_admin.middleware import (
     HtmxMessageMiddleware,
     HtmxRedirectMiddleware,
     HtmxVaryHeaderMiddleware,
+    _is_htmx,
 )
 
 
-class HtmxMessageMiddlewareTest(TestCase):
-    """Test 5: Toast middleware - Django messages appear as HX-Trigger"""
+# Template requests built once at import; the middleware only reads them,
+# so each test works on a cheap shallow copy instead of re-running the
+# RequestFactory's WSGI environ construction
+_factory = RequestFactory()
+_REQ_PLAIN = _factory.get('/')
+_REQ_HTMX = _factory.get('/', HTTP_HX_REQUEST='true')
+
 
-    def setUp(self):
-        """Set up request factory."""
-        self.factory = RequestFactory()
+class HtmxMessageMiddlewareTest(SimpleTestCase):
+    """Test 5: Toast middleware - Django messages appear as HX-Trigger"""
 
-    def get_response(self, request):
+    @staticmethod
+    def get_response(request):
         """Simple view that returns empty response."""
         return HttpResponse()
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the middleware once; it holds no per-test state."""
+        super().setUpClass()
+        cls.middleware = HtmxMessageMiddleware(cls.get_response)
+
     def test_non_htmx_request_unchanged(self):
         """Test that non-HTMX requests are not modified."""
-        middleware = HtmxMessageMiddleware(self.get_response)
-        request = self.factory.get('/')
+        request = copy.copy(_REQ_PLAIN)
 
-        response = middleware(request)
+        # The middleware's contract is to leave non-HTMX responses alone,
+        # which it decides via _is_htmx; asserting that branch condition
+        # directly avoids running the full request/response chain
+        self.assertFalse(_is_htmx(request))
+
+        response = self.middleware(request)
 
         self.assertNotIn('HX-Trigger', response)
 
@@ -55,7 +72,7 @@ class HtmxMessageMiddlewareTest(TestCase):
         #     return HttpResponse()
         #
         # middleware = HtmxMessageMiddleware(get_response_with_message)
-        # request = self.factory.get('/', HTTP_HX_REQUEST='true')
+        # request = copy.copy(_REQ_HTMX)
         #
         # # Setup session and messages
         # session_middleware = SessionMiddleware(lambda x: x)
@@ -73,71 +90,67 @@ class HtmxMessageMiddlewareTest(TestCase):
 
     def test_htmx_request_without_messages(self):
         """Test that HTMX requests without messages don't add HX-Trigger."""
-        middleware = HtmxMessageMiddleware(self.get_response)
-        request = self.factory.get('/', HTTP_HX_REQUEST='true')
+        request = copy.copy(_REQ_HTMX)
 
-        response = middleware(request)
+        response = self.middleware(request)
 
         # Response should not have HX-Trigger if no messages
         # (or should have empty showMessages)
         pass
 
 
-class HtmxRedirectMiddlewareTest(TestCase):
+class HtmxRedirectMiddlewareTest(SimpleTestCase):
     """Tests for redirect middleware."""
 
-    def setUp(self):
-        """Set up request factory."""
-        self.factory = RequestFactory()
+    @staticmethod
+    def get_response(request):
+        """View that always redirects."""
+        return HttpResponseRedirect('/new-url/')
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the middleware once; both tests use the same chain."""
+        super().setUpClass()
+        cls.middleware = HtmxRedirectMiddleware(cls.get_response)
 
     def test_non_htmx_redirect_unchanged(self):
         """Test that non-HTMX redirects are not modified."""
-        from django.http import HttpResponseRedirect
-
-        def get_response(request):
-            return HttpResponseRedirect('/new-url/')
+        request = copy.copy(_REQ_PLAIN)
 
-        middleware = HtmxRedirectMiddleware(get_response)
-        request = self.factory.get('/')
-
-        response = middleware(request)
+        response = self.middleware(request)
 
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response['Location'], '/new-url/')
 
     def test_htmx_redirect_converted(self):
         """Test that HTMX redirects are converted to HX-Redirect."""
-        from django.http import HttpResponseRedirect
+        request = copy.copy(_REQ_HTMX)
 
-        def get_response(request):
-            return HttpResponseRedirect('/new-url/')
-
-        middleware = HtmxRedirectMiddleware(get_response)
-        request = self.factory.get('/', HTTP_HX_REQUEST='true')
-
-        response = middleware(request)
+        response = self.middleware(request)
 
         self.assertEqual(response.status_code, 204)
         self.assertEqual(response['HX-Redirect'], '/new-url/')
 
 
-class HtmxVaryHeaderMiddlewareTest(TestCase):
+class HtmxVaryHeaderMiddlewareTest(SimpleTestCase):
     """Tests for vary header middleware."""
 
-    def setUp(self):
-        """Set up request factory."""
-        self.factory = RequestFactory()
-
-    def get_response(self, request):
+    @staticmethod
+    def get_response(request):
         """Simple view that returns empty response."""
         return HttpResponse()
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the middleware once for the common empty-response case."""
+        super().setUpClass()
+        cls.middleware = HtmxVaryHeaderMiddleware(cls.get_response)
+
     def test_vary_header_added(self):
         """Test that HX-Request is added to Vary header."""
-        middleware = HtmxVaryHeaderMiddleware(self.get_response)
-        request = self.factory.get('/')
+        request = copy.copy(_REQ_PLAIN)
 
-        response = middleware(request)
+        response = self.middleware(request)
 
         vary = response.get('Vary', '')
         self.assertIn('HX-Request', vary)
@@ -150,7 +163,7 @@ class HtmxVaryHeaderMiddlewareTest(TestCase):
             return response
 
         middleware = HtmxVaryHeaderMiddleware(get_response)
-        request = self.factory.get('/')
+        request = copy.copy(_REQ_PLAIN)
 
         response = middleware(request)
 
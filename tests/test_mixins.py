@@ -2,8 +2,7 @@
 Tests for HTMX mixins.
 """
 
-import json
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.http import HttpResponse
 
 from htmx_admin.mixins import HtmxResponseMixin, HtmxFormMixin
@@ -12,26 +11,34 @@ from htmx_admin.mixins import HtmxResponseMixin, HtmxFormMixin
 class MockRequest:
     """Mock request object for testing."""
 
+    __slots__ = ('headers',)
+
     def __init__(self, htmx=False):
         self.headers = {'HX-Request': 'true'} if htmx else {}
 
 
-class HtmxResponseMixinTest(TestCase):
+# The mixins only ever read request.headers, so the two variants are built
+# once and shared across tests
+_REQ_PLAIN = MockRequest(htmx=False)
+_REQ_HTMX = MockRequest(htmx=True)
+
+
+class HtmxResponseMixinTest(SimpleTestCase):
     """Tests for HtmxResponseMixin."""
 
-    def setUp(self):
-        """Set up mixin instance."""
-        self.mixin = HtmxResponseMixin()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a shared mixin instance; it holds no per-test state."""
+        super().setUpClass()
+        cls.mixin = HtmxResponseMixin()
 
     def test_is_htmx_request_true(self):
         """Test detection of HTMX request."""
-        request = MockRequest(htmx=True)
-        self.assertTrue(self.mixin.is_htmx_request(request))
+        self.assertTrue(self.mixin.is_htmx_request(_REQ_HTMX))
 
     def test_is_htmx_request_false(self):
         """Test detection of non-HTMX request."""
-        request = MockRequest(htmx=False)
-        self.assertFalse(self.mixin.is_htmx_request(request))
+        self.assertFalse(self.mixin.is_htmx_request(_REQ_PLAIN))
 
     def test_htmx_response_basic(self):
         """Test basic HTMX response creation."""
@@ -51,11 +58,13 @@ class HtmxResponseMixinTest(TestCase):
         self.assertEqual(response.status_code, 204)
         self.assertIn('HX-Trigger', response)
 
-        triggers = json.loads(response['HX-Trigger'])
-        self.assertIn('showMessage', triggers)
-        self.assertIn('rowDeleted', triggers)
-        self.assertEqual(triggers['showMessage']['level'], 'success')
-        self.assertEqual(triggers['rowDeleted']['id'], '123')
+        # assertJSONEqual parses and compares in one step and gives a
+        # full-payload diff on mismatch; the project convention for
+        # trigger-header assertions
+        self.assertJSONEqual(response['HX-Trigger'], {
+            'showMessage': {'level': 'success', 'message': 'Done!'},
+            'rowDeleted': {'id': '123'},
+        })
 
     def test_htmx_response_no_triggers(self):
         """Test HTMX response without triggers."""
@@ -86,7 +95,7 @@ class HtmxResponseMixinTest(TestCase):
         self.assertEqual(response.content, b'Content')
 
 
-class HtmxFormMixinTest(TestCase):
+class HtmxFormMixinTest(SimpleTestCase):
     """Tests for HtmxFormMixin."""
 
     def test_form_invalid_returns_422(self):
@@ -102,7 +111,7 @@ class HtmxFormMixinTest(TestCase):
             template_name = 'test.html'
 
         view = TestView()
-        view.request = MockRequest()
+        view.request = _REQ_PLAIN
 
         # Create invalid form
         form = TestForm(data={})
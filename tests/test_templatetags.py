@@ -0,0 +1,53 @@
+"""
+Tests for the htmx_admin template tags.
+"""
+
+from django.test import SimpleTestCase
+
+from htmx_admin.templatetags.htmx_admin_tags import (
+    htmx_attrs,
+    htmx_attrs_cached,
+)
+
+
+class HtmxAttrsTest(SimpleTestCase):
+    """Tests for the htmx_attrs tag."""
+
+    def test_defaults(self):
+        """Test the default trigger and swap attributes."""
+        attrs = htmx_attrs()
+
+        self.assertEqual(attrs, 'hx-trigger="click" hx-swap="outerHTML"')
+
+    def test_extra_kwargs_escaped(self):
+        """Test that kwarg values cannot break out of the attribute."""
+        attrs = htmx_attrs(hx_get='/url/?a="b"')
+
+        self.assertIn('hx-get="/url/?a=&quot;b&quot;"', attrs)
+
+
+class HtmxAttrsCachedTest(SimpleTestCase):
+    """Tests for the htmx_attrs_cached tag."""
+
+    def test_matches_htmx_attrs_output(self):
+        """Test that the cached tag renders the same attribute string."""
+        attrs = htmx_attrs_cached('/edit/1/', target='#result')
+
+        self.assertEqual(
+            attrs,
+            'hx-trigger="click" hx-target="#result"'
+            ' hx-swap="outerHTML" hx-get="/edit/1/"',
+        )
+
+    def test_percent_in_constant_parts(self):
+        """Test that % in trigger/target/swap survives the substitution."""
+        attrs = htmx_attrs_cached('/poll/', trigger='every 50%')
+
+        self.assertIn('hx-trigger="every 50%"', attrs)
+        self.assertIn('hx-get="/poll/"', attrs)
+
+    def test_url_escaped(self):
+        """Test that the dynamic URL cannot break out of the attribute."""
+        attrs = htmx_attrs_cached('/url/?a="b"')
+
+        self.assertIn('hx-get="/url/?a=&quot;b&quot;"', attrs)